@@ -12,12 +12,14 @@
 import os
 import pkgutil
 import textwrap
+from functools import lru_cache
 
 from ipywidgets.embed import __html_manager_version__
 
 __all__ = ['requirejs_script', 'widgets_script', 'suite_template', 'jupyterlab_plotly_script']
 
 
+@lru_cache(maxsize=None)
 def requirejs_script(connected: bool = True):
     """Return requirejs script.
 
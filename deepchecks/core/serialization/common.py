@@ -15,6 +15,7 @@ import json
 import textwrap
 import typing as t
 from contextlib import contextmanager
+from functools import lru_cache
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -37,6 +38,8 @@ __all__ = [
     'aggregate_conditions',
     'create_results_dataframe',
     'create_failures_dataframe',
+    'create_failures_list',
+    'create_failures_table',
     'form_output_anchor',
     'Html',
     'normalize_widget_style',
@@ -245,11 +248,30 @@ def create_failures_dataframe(
     pd.Dataframe:
         the condition table.
     """
-    data = []
+    return pd.DataFrame(data=create_failures_list(failures), columns=['Check', 'Reason'])
+
+
+def create_failures_list(
+    failures: t.Sequence[t.Union['check_types.CheckFailure', 'check_types.CheckResult']]
+) -> t.List[t.Tuple[str, str]]:
+    """Create list of check failures, errors are placed before results without display.
+
+    Parameters
+    ----------
+    failures : Sequence[Union[CheckFailure, CheckResult]]
+        check failures
+
+    Returns
+    -------
+    List[Tuple[str, str]]:
+        list of (check header, reason) pairs.
+    """
+    errors_list = []
+    nothing_found_list = []
 
     for it in failures:
         if isinstance(it, check_types.CheckResult):
-            data.append([it.get_header(), 'Nothing found', 2])
+            nothing_found_list.append((it.get_header(), 'Nothing found'))
         elif isinstance(it, check_types.CheckFailure):
             message = (
                 it.exception.html
@@ -262,16 +284,42 @@ def create_failures_dataframe(
             )
             if isinstance(it.exception, error_types):
                 message = f'{type(it.exception).__name__}: {message}'
-            data.append((it.header, message, 1))
+            errors_list.append((it.header, message))
         else:
             raise TypeError(f'Unknown result type - {type(it).__name__}')
 
-    df = pd.DataFrame(data=data, columns=['Check', 'Reason', 'priority'])
-    df.sort_values(by=['priority'], inplace=True)
-    df.drop('priority', axis=1, inplace=True)
-    return df
+    return errors_list + nothing_found_list
+
+
+def create_failures_table(
+    failures: t.Sequence[t.Union['check_types.CheckFailure', 'check_types.CheckResult']]
+) -> str:
+    """Create html table with check failures.
+
+    Parameters
+    ----------
+    failures : Sequence[Union[CheckFailure, CheckResult]]
+        check failures
+
+    Returns
+    -------
+    str:
+        the failures table.
+    """
+    # NOTE: cells are not escaped, failure reasons might be already formatted html
+    rows = ''.join(
+        f'<tr><td>{header}</td><td>{reason}</td></tr>'
+        for header, reason in create_failures_list(failures)
+    )
+    return (
+        '<table style="text-align: left; white-space: pre-wrap;">'
+        '<thead><tr><th style="text-align: left;">Check</th><th style="text-align: left;">Reason</th></tr></thead>'
+        f'<tbody>{rows}</tbody>'
+        '</table>'
+    )
 
 
+@lru_cache(maxsize=None)
 def plotlyjs_script(connected: bool = True) -> str:
     """Return plotly activation script in the requirejs enviroment.
 
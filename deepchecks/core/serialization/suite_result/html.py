@@ -10,9 +10,9 @@
 #
 # pylint: disable=unused-argument
 """Module containing html serializer for the SuiteResult type."""
+import io
 import textwrap
 import typing as t
-import warnings
 
 from deepchecks.core import check_result as check_types
 from deepchecks.core import suite
@@ -20,15 +20,57 @@ from deepchecks.core.resources import requirejs_script
 from deepchecks.core.serialization.abc import HtmlSerializer
 from deepchecks.core.serialization.check_result.html import CheckResultSection
 from deepchecks.core.serialization.check_result.html import CheckResultSerializer as CheckResultHtmlSerializer
-from deepchecks.core.serialization.common import (Html, aggregate_conditions, create_failures_dataframe,
-                                                  form_output_anchor, plotlyjs_script)
+from deepchecks.core.serialization.common import (Html, aggregate_conditions, create_failures_table, form_output_anchor,
+                                                  plotlyjs_script)
 from deepchecks.core.serialization.dataframe.html import DataFrameSerializer as DataFrameHtmlSerializer
-from deepchecks.utils.dataframes import hide_index_for_display
-from deepchecks.utils.html import linktag
 
 __all__ = ['SuiteResultSerializer']
 
 
+# TODO: use some style to make it pretty
+_FULL_HTML_TEMPLATE = textwrap.dedent("""
+    <html>
+    <head><meta charset="utf-8"/></head>
+    <body style="background-color: white; padding: 1rem 1rem 0 1rem;">
+        {requirejs}
+        {plotlyjs}
+        {body}
+    </body>
+    </html>
+""")
+_FULL_HTML_HEAD, _FULL_HTML_TAIL = _FULL_HTML_TEMPLATE.split('{body}')
+
+_CONDITION_ICONS = textwrap.dedent("""
+    <span style="color: green;display:inline-block">\U00002713</span>
+    <span style="color: red;display:inline-block">\U00002716</span>
+    <span style="color: orange;font-weight:bold;display:inline-block">\U00000021</span>
+    <span style="color: firebrick;font-weight:bold;display:inline-block">\U00002048</span>
+""").strip().splitlines()
+
+_SUITE_CREATION_EXAMPLE_LINK = (
+    'https://docs.deepchecks.com/stable/general/usage/customizations/'
+    'auto_examples/plot_create_a_custom_suite.html'
+    '?utm_source=display_output&utm_medium=referral&utm_campaign=suite_link'
+)
+
+_HEADER_TEMPLATE = '<h1>{name}</h1>'
+_HEADER_WITH_ANCHOR_TEMPLATE = '<h1 id="{anchor}">{name}</h1>'
+_GO_TO_TOP_TEMPLATE = '<br><a href="{href}" style="font-size: 14px;">Go to top</a>'
+
+_SUMMARY_TEMPLATE = textwrap.dedent("""
+    {{header}}
+    <p>
+        {{prologue}}<br>
+        Each check may contain conditions (which will result in pass {icons[0]} /
+        fail {icons[1]} / warning {icons[2]} / error {icons[3]}) as well as
+        other outputs such as plots or tables.<br>
+        Suites, checks and conditions can all be modified. Read more about
+        <a href={link} target="_blank">custom suites</a>.
+    </p>
+    {{extra_info}}
+""").format(icons=_CONDITION_ICONS, link=_SUITE_CREATION_EXAMPLE_LINK)
+
+
 class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
     """Serializes any SuiteResult instance into HTML format.
 
@@ -44,6 +86,19 @@ class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
                 f'Expected "SuiteResult" but got "{type(value).__name__}"'
             )
         super().__init__(value=value)
+        self._results_with_condition = t.cast(
+            t.List[check_types.CheckResult],
+            value.select_results(value.results_with_conditions)
+        )
+        self._results_with_condition_and_display = t.cast(
+            t.List[check_types.CheckResult],
+            value.select_results(value.results_with_conditions & value.results_with_display)
+        )
+        self._results_without_condition = t.cast(
+            t.List[check_types.CheckResult],
+            value.select_results(value.results_without_conditions & value.results_with_display)
+        )
+        self._failures = value.select_results(value.failures | value.results_without_display)
 
     def serialize(
         self,
@@ -88,74 +143,72 @@ class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
 
         kwargs['is_for_iframe_with_srcdoc'] = is_for_iframe_with_srcdoc
 
-        summary = self.prepare_summary(output_id=output_id, **kwargs)
-        conditions_table = self.prepare_conditions_table(output_id=output_id, **kwargs)
-        failures = self.prepare_failures_list()
+        plotlyjs = plotlyjs_script(connected) if include_plotlyjs is True else ''
+        requirejs = requirejs_script(connected) if include_requirejs is True else ''
+
+        # all sections are written into one buffer, so that only the final
+        # output and the section being rendered are held in memory at once
+        buffer = io.StringIO()
 
-        results_with_conditions = self.prepare_results_with_condition_and_display(
+        if full_html is True:
+            buffer.write(_FULL_HTML_HEAD.format(requirejs=requirejs, plotlyjs=plotlyjs))
+        else:
+            buffer.write(requirejs)
+            buffer.write(plotlyjs)
+
+        if not self.value.results:
+            buffer.write(self.prepare_header(output_id))
+            buffer.write('<p>Suite produced no results.</p>')
+            if full_html is True:
+                buffer.write(_FULL_HTML_TAIL)
+            return buffer.getvalue()
+
+        buffer.write(self.prepare_summary(output_id=output_id, **kwargs))
+        buffer.write(Html.bold_hr)
+        buffer.write(self.prepare_conditions_table(output_id=output_id, **kwargs))
+        buffer.write(Html.bold_hr)
+        self._write_results_with_condition_and_display(
+            buffer,
             output_id=output_id,
             check_sections=['condition-table', 'additional-output'],
             **kwargs
         )
-        results_without_conditions = self.prepare_results_without_condition(
+        buffer.write(Html.bold_hr)
+        self._write_results_without_condition(
+            buffer,
             output_id=output_id,
             check_sections=['additional-output'],
             **kwargs
         )
-        sections = [
-            summary,
-            Html.bold_hr,
-            conditions_table,
-            Html.bold_hr,
-            results_with_conditions,
-            Html.bold_hr,
-            results_without_conditions,
-        ]
 
+        failures = self.prepare_failures_list()
         if failures:
-            sections.extend([Html.bold_hr, failures])
+            buffer.write(Html.bold_hr)
+            buffer.write(failures)
 
         if output_id:
-            anchor = form_output_anchor(output_id)
-            link = linktag(
-                text='Go to top',
-                href=f'#{anchor}',
-                style={'font-size': '14px'},
-                is_for_iframe_with_srcdoc=is_for_iframe_with_srcdoc
-            )
-            sections.append(f'<br>{link}')
+            href = f'#{form_output_anchor(output_id)}'
+            if is_for_iframe_with_srcdoc:
+                href = f'about:srcdoc{href}'
+            buffer.write(_GO_TO_TOP_TEMPLATE.format(href=href))
 
-        plotlyjs = plotlyjs_script(connected) if include_plotlyjs is True else ''
-        requirejs = requirejs_script(connected) if include_requirejs is True else ''
+        if full_html is True:
+            buffer.write(_FULL_HTML_TAIL)
 
-        if full_html is False:
-            return ''.join([requirejs, plotlyjs, *sections])
-
-        # TODO: use some style to make it pretty
-        return textwrap.dedent(f"""
-            <html>
-            <head><meta charset="utf-8"/></head>
-            <body style="background-color: white; padding: 1rem 1rem 0 1rem;">
-                {requirejs}
-                {plotlyjs}
-                {''.join(sections)}
-            </body>
-            </html>
-        """)
+        return buffer.getvalue()
 
     def prepare_prologue(self) -> str:
         """Prepare prologue section."""
         long_prologue_version = 'The suite is composed of various checks such as: {names}, etc...'
         short_prologue_version = 'The suite is composed of the following checks: {names}.'
-        check_names = list(set(
-            it.check.name()
-            for it in self.value.results
-        ))
-        return (
-            long_prologue_version.format(names=', '.join(check_names[:3]))
-            if len(check_names) > 3
-            else short_prologue_version.format(names=', '.join(check_names))
-        )
+        # dict is used as an insertion ordered set, the iteration stops
+        # as soon as more names are found than the prologue shows
+        check_names = {}
+        for it in self.value.results:
+            check_names[it.check.name()] = None
+            if len(check_names) > 3:
+                return long_prologue_version.format(names=', '.join(list(check_names)[:3]))
+        return short_prologue_version.format(names=', '.join(check_names))
 
     def prepare_header(self, output_id: t.Optional[str] = None, **kwargs) -> str:
         """Prepare header section.
@@ -169,8 +222,9 @@ class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
         -------
         str
         """
-        idattr = f' id="{form_output_anchor(output_id)}"' if output_id else ''
-        return f'<h1{idattr}>{self.value.name}</h1>'
+        if output_id:
+            return _HEADER_WITH_ANCHOR_TEMPLATE.format(anchor=form_output_anchor(output_id), name=self.value.name)
+        return _HEADER_TEMPLATE.format(name=self.value.name)
 
     def prepare_extra_info(self) -> str:
         """Prepare extra info section."""
@@ -196,29 +250,11 @@ class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
         prologue = self.prepare_prologue()
         extra_info = self.prepare_extra_info()
 
-        suite_creation_example_link = (
-            'https://docs.deepchecks.com/stable/general/usage/customizations/'
-            'auto_examples/plot_create_a_custom_suite.html'
-            '?utm_source=display_output&utm_medium=referral&utm_campaign=suite_link'
+        return _SUMMARY_TEMPLATE.format(
+            header=header,
+            prologue=prologue,
+            extra_info=extra_info
         )
-        icons = textwrap.dedent("""
-            <span style="color: green;display:inline-block">\U00002713</span>
-            <span style="color: red;display:inline-block">\U00002716</span>
-            <span style="color: orange;font-weight:bold;display:inline-block">\U00000021</span>
-            <span style="color: firebrick;font-weight:bold;display:inline-block">\U00002048</span>
-        """).splitlines()
-        return textwrap.dedent(f"""
-            {header}
-            <p>
-                {prologue}<br>
-                Each check may contain conditions (which will result in pass {icons[1]} /
-                fail {icons[2]} / warning {icons[3]} / error {icons[4]}) as well as
-                other outputs such as plots or tables.<br>
-                Suites, checks and conditions can all be modified. Read more about
-                <a href={suite_creation_example_link} target="_blank">custom suites</a>.
-            </p>
-            {extra_info}
-        """)
 
     def prepare_conditions_table(
         self,
@@ -244,15 +280,11 @@ class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
         -------
         str
         """
-        if not self.value.results_with_conditions:
+        if not self._results_with_condition:
             return '<p>No conditions defined on checks in the suite.</p>'
 
-        results = t.cast(
-            t.List[check_types.CheckResult],
-            self.value.select_results(self.value.results_with_conditions)
-        )
         table = DataFrameHtmlSerializer(aggregate_conditions(
-            results,
+            self._results_with_condition,
             output_id=output_id,
             include_check_name=include_check_name,
             max_info_len=300,
@@ -281,24 +313,34 @@ class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
         -------
         str
         """
-        results = t.cast(
-            t.List[check_types.CheckResult],
-            self.value.select_results(
-                self.value.results_with_conditions & self.value.results_with_display
-            )
+        buffer = io.StringIO()
+        self._write_results_with_condition_and_display(
+            buffer,
+            output_id=output_id,
+            check_sections=check_sections,
+            **kwargs
         )
-        results_with_condition_and_display = [
-            CheckResultHtmlSerializer(it).serialize(
+        return buffer.getvalue()
+
+    def _write_results_with_condition_and_display(
+        self,
+        buffer: io.StringIO,
+        output_id: t.Optional[str] = None,
+        check_sections: t.Optional[t.Sequence[CheckResultSection]] = None,
+        **kwargs
+    ):
+        """Write subsection of the content that shows results with conditions into the buffer."""
+        buffer.write('<h2>Check With Conditions Output</h2>')
+        for index, it in enumerate(self._results_with_condition_and_display):
+            if index > 0:
+                buffer.write(Html.light_hr)
+            buffer.write(CheckResultHtmlSerializer(it).serialize(
                 output_id=output_id,
                 check_sections=check_sections,
                 include_plotlyjs=False,
                 include_requirejs=False,
                 **kwargs
-            )
-            for it in results
-        ]
-        content = Html.light_hr.join(results_with_condition_and_display)
-        return f'<h2>Check With Conditions Output</h2>{content}'
+            ))
 
     def prepare_results_without_condition(
         self,
@@ -320,36 +362,39 @@ class SuiteResultSerializer(HtmlSerializer['suite.SuiteResult']):
         -------
         str
         """
-        results = t.cast(
-            t.List[check_types.CheckResult],
-            self.value.select_results(
-                self.value.results_without_conditions & self.value.results_with_display,
-            )
+        buffer = io.StringIO()
+        self._write_results_without_condition(
+            buffer,
+            output_id=output_id,
+            check_sections=check_sections,
+            **kwargs
         )
-        results_without_conditions = [
-            CheckResultHtmlSerializer(it).serialize(
+        return buffer.getvalue()
+
+    def _write_results_without_condition(
+        self,
+        buffer: io.StringIO,
+        output_id: t.Optional[str] = None,
+        check_sections: t.Optional[t.Sequence[CheckResultSection]] = None,
+        **kwargs
+    ):
+        """Write subsection of the content that shows results without conditions into the buffer."""
+        buffer.write('<h2>Check Without Conditions Output</h2>')
+        for index, it in enumerate(self._results_without_condition):
+            if index > 0:
+                buffer.write(Html.light_hr)
+            buffer.write(CheckResultHtmlSerializer(it).serialize(
                 output_id=output_id,
                 include=check_sections,
                 include_plotlyjs=False,
                 include_requirejs=False,
                 **kwargs
-            )
-            for it in results
-        ]
-        content = Html.light_hr.join(results_without_conditions)
-        return f'<h2>Check Without Conditions Output</h2>{content}'
+            ))
 
     def prepare_failures_list(self, **kwargs) -> str:
         """Prepare subsection of the content that shows list of failures."""
-        results = self.value.select_results(self.value.failures | self.value.results_without_display)
-
-        if not results:
+        if not self._failures:
             return ''
 
-        df = create_failures_dataframe(results)
-
-        with warnings.catch_warnings():
-            warnings.simplefilter(action='ignore', category=FutureWarning)
-            styler = hide_index_for_display(df)
-            table = DataFrameHtmlSerializer(styler).serialize()
-            return f'<h2>Other Checks That Weren\'t Displayed</h2>\n{table}'
+        table = create_failures_table(self._failures)
+        return f'<h2>Other Checks That Weren\'t Displayed</h2>\n{table}'
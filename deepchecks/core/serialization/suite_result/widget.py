@@ -21,9 +21,8 @@ from deepchecks.core.serialization.abc import WidgetSerializer
 from deepchecks.core.serialization.check_failure.widget import CheckFailureSerializer as CheckFailureWidgetSerializer
 from deepchecks.core.serialization.check_result.widget import CheckResultSerializer as CheckResultWidgetSerializer
 from deepchecks.core.serialization.common import Html as CommonHtml
-from deepchecks.core.serialization.common import (aggregate_conditions, create_failures_dataframe,
-                                                  create_results_dataframe, form_output_anchor, join,
-                                                  normalize_widget_style)
+from deepchecks.core.serialization.common import (aggregate_conditions, create_failures_table, create_results_dataframe,
+                                                  form_output_anchor, join, normalize_widget_style)
 from deepchecks.core.serialization.dataframe.widget import DataFrameSerializer
 from deepchecks.utils.dataframes import hide_index_for_display
 from deepchecks.utils.strings import get_random_string
@@ -154,9 +153,7 @@ class SuiteResultSerializer(WidgetSerializer['suite.SuiteResult']):
         if len(failures) == 0:
             children = (HTML(value='<p>No outputs to show.</p>'),)
         else:
-            styler = hide_index_for_display(create_failures_dataframe(failures))
-            table = DataFrameSerializer(styler).serialize()
-            children = (table,)
+            children = (HTML(value=create_failures_table(failures)),)
         accordion = normalize_widget_style(Accordion(
             children=children,
             _titles={'0': title},
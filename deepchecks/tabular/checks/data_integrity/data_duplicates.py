@@ -12,6 +12,7 @@
 from typing import List, Union
 
 import numpy as np
+import pandas as pd
 
 from deepchecks.core import CheckResult
 from deepchecks.core.errors import DatasetValidationError
@@ -67,54 +68,88 @@ class DataDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
         CheckResult
             percentage of duplicates and display of the top n_to_show most duplicated.
         """
-        df = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state).data
+        # only the dataframe is needed, sampling it without building a new Dataset instance
+        # avoids copying the sampled data once more
+        df = context.get_data_by_kind(dataset_kind).sample_data(self.n_samples, random_state=self.random_state)
         df = select_from_dataframe(df, self.columns, self.ignore_columns)
 
-        data_columns = list(df.columns)
         n_samples = df.shape[0]
 
         if n_samples == 0:
             raise DatasetValidationError('Dataset does not contain any data')
 
-        # HACK: pandas have bug with groupby on category dtypes, so until it fixed, change dtypes manually
+        # categorical columns are hashed by their integer codes (NaN is encoded as -1),
+        # there is no need to convert them into object columns
         category_columns = df.dtypes[df.dtypes == 'category'].index.tolist()
-        if category_columns:
-            df = df.astype({c: 'object' for c in category_columns})
-
-        group_unique_data = df[data_columns].groupby(data_columns, dropna=False).size()
-        n_unique = len(group_unique_data)
+        # object and float columns are hashed by their factorized codes, as hash_pandas_object
+        # converts object values to strings, which would make values like 1 and '1' equal,
+        # and hashes floats by their bits, which would make 0.0 and -0.0 (or nan and -nan) differ
+        factorized_columns = [
+            column for column, dtype in df.dtypes.items()
+            if dtype == 'object' or dtype.kind == 'f'
+        ]
+        hashed_data = df.copy(deep=False) if category_columns or factorized_columns else df
+        for column in category_columns:
+            hashed_data[column] = df[column].cat.codes
+        for column in factorized_columns:
+            hashed_data[column] = pd.factorize(df[column])[0]
+
+        # each row is hashed into a single uint64 value, so the duplicates are counted
+        # over one column of hashes instead of over all the data columns
+        row_hashes = pd.util.hash_pandas_object(hashed_data, index=False).to_numpy()
+
+        # uniqueness test is cheaper than counting the groups, which is not needed without duplicates
+        if pd.Index(row_hashes).is_unique:
+            return CheckResult(value=0.0, display=None)
+
+        unique_hashes, first_positions, inverse, counts = np.unique(
+            row_hashes,
+            return_index=True,
+            return_inverse=True,
+            return_counts=True
+        )
+        n_unique = unique_hashes.size
 
         percent_duplicate = 1 - (1.0 * int(n_unique)) / (1.0 * int(n_samples))
 
-        if context.with_display and percent_duplicate > 0:
-            # patched for anonymous_series
-            # TODO: reset_index(name=...) can be used instead of this confusing hack
-            is_anonymous_series = 0 in group_unique_data.keys().names
-            if is_anonymous_series:
-                new_name = str(group_unique_data.keys().names)
-                new_index = group_unique_data.keys()
-                new_index.names = [new_name if name == 0 else name for name in new_index.names]
-                group_unique_data = group_unique_data.reindex(new_index)
-            duplicates_counted = group_unique_data.reset_index().rename(columns={0: 'Number of Duplicates'})
-            if is_anonymous_series:
-                duplicates_counted.rename(columns={new_name: 0}, inplace=True)
-
-            most_duplicates = duplicates_counted[duplicates_counted['Number of Duplicates'] > 1]. \
-                nlargest(self.n_to_show, ['Number of Duplicates'])
-
-            indexes = []
-            for row in most_duplicates.iloc():
-                indexes.append(format_list(df.index[np.all(df == row[data_columns], axis=1)].to_list()))
-
-            most_duplicates['Instances'] = indexes
-
-            most_duplicates = most_duplicates.set_index(['Instances', 'Number of Duplicates'])
+        if context.with_display:
+            duplicated_groups = np.flatnonzero(counts > 1)
+            n_to_show = min(self.n_to_show, duplicated_groups.size)
+            # the groups that can be shown are found with a partition instead of a full sort, then only
+            # they are ordered by their size and, for equally sized groups, by their first appearance
+            min_count = np.partition(counts[duplicated_groups], -n_to_show)[-n_to_show] if n_to_show else np.inf
+            candidates = duplicated_groups[counts[duplicated_groups] >= min_count]
+            shown_groups = candidates[np.lexsort((first_positions[candidates], -counts[candidates]))][:n_to_show]
+            shown_counts = counts[shown_groups]
+
+            # positions of the rows of all shown groups are ordered by the group they belong to
+            # (keeping the rows order within each group) and split by the groups sizes
+            group_ranks = np.full(n_unique, -1)
+            group_ranks[shown_groups] = np.arange(shown_groups.size)
+            row_ranks = group_ranks[inverse]
+            shown_positions = np.flatnonzero(row_ranks >= 0)
+            shown_positions = shown_positions[np.argsort(row_ranks[shown_positions], kind='stable')]
+            group_positions = np.split(shown_positions, np.cumsum(shown_counts)[:-1]) if n_to_show else []
+
+            # numeric and object labels are read directly from the index values without creating
+            # an intermediate pd.Index, other types (like datetime) must be boxed by pandas
+            if df.index.dtype.kind in 'biufO':
+                index_values = df.index.to_numpy()
+                instances = [index_values[positions].tolist() for positions in group_positions]
+            else:
+                instances = [df.index[positions].to_list() for positions in group_positions]
+
+            most_duplicates = df.iloc[first_positions[shown_groups]]
+            most_duplicates.index = pd.MultiIndex.from_arrays(
+                [
+                    [format_list(it) for it in instances],
+                    shown_counts
+                ],
+                names=['Instances', 'Number of Duplicates']
+            )
 
             text = f'{format_percent(percent_duplicate)} of data samples are duplicates. '
             explanation = 'Each row in the table shows an example of duplicate data and the number of times it appears.'
-            display = [text, explanation, most_duplicates]
-
-        else:
-            display = None
+            return CheckResult(value=percent_duplicate, display=[text, explanation, most_duplicates])
 
-        return CheckResult(value=percent_duplicate, display=display)
+        return CheckResult(value=percent_duplicate)
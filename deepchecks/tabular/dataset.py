@@ -461,8 +461,31 @@ class Dataset:
         if n_samples is None:
             return self
 
+        return self.copy(self.sample_data(n_samples, replace=replace, random_state=random_state))
+
+    def sample_data(self, n_samples: t.Optional[int] = None, replace: bool = False,
+                    random_state: t.Optional[int] = None) -> pd.DataFrame:
+        """Return a sample of the internal dataframe, without creating a new dataset object.
+
+        Parameters
+        ----------
+        n_samples : t.Optional[int]
+            Number of samples to draw.
+        replace : bool, default: False
+            Whether to sample with replacement.
+        random_state : t.Optional[int] , default None
+            Random state.
+
+        Returns
+        -------
+        pd.DataFrame
+            sample of the internal dataframe, or the internal dataframe itself if n_samples is None.
+        """
+        if n_samples is None:
+            return self.data
+
         n_samples = min(n_samples, len(self.data))
-        return self.copy(self.data.sample(n_samples, replace=replace, random_state=random_state))
+        return self.data.sample(n_samples, replace=replace, random_state=random_state)
 
     def drop_na_labels(self) -> TDataset:
         """Create a copy of the dataset object without samples with missing labels."""
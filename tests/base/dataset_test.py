@@ -816,6 +816,18 @@ def test_sample_drop_nan_labels(iris):
     assert_that(sample, has_length(50))
 
 
+def test_sample_data(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    # Act
+    sample = dataset.sample_data(10, random_state=0)
+    # Assert
+    assert_that(sample, instance_of(pd.DataFrame))
+    assert_that(sample.index.to_list(), equal_to(dataset.sample(10, random_state=0).data.index.to_list()))
+    assert_that(dataset.sample_data(10000), has_length(150))
+    assert_that(dataset.sample_data(None) is dataset.data)
+
+
 def test__ensure_not_empty_dataset__with_empty_dataset():
     # Assert
     assert_that(
@@ -31,7 +31,7 @@ from deepchecks.core.serialization.suite_result.wandb import SuiteResultSerializ
 from deepchecks.core.serialization.suite_result.widget import SuiteResultSerializer as WidgetSerializer
 from deepchecks.core.suite import SuiteResult
 from deepchecks.utils.strings import get_random_string
-from tests.common import create_suite_result, instance_of_ipython_formatter
+from tests.common import DummyCheck, create_check_result, create_suite_result, instance_of_ipython_formatter
 from tests.serialization.test_check_failure_serialization import assert_json_output as assert_check_failure_json_output
 from tests.serialization.test_check_result_serialization import assert_json_output as assert_check_result_json_output
 
@@ -66,6 +66,16 @@ def test_html_serialization():
     )
 
 
+def test_html_serialization_of_empty_suite():
+    suite_result = SuiteResult(name='Empty Suite', results=[])
+    output = HtmlSerializer(suite_result).serialize(include_plotlyjs=False)
+
+    assert_that(
+        output,
+        equal_to('<h1>Empty Suite</h1><p>Suite produced no results.</p>')
+    )
+
+
 def test_html_serialization_with__output_id__parameter():
     suite_result = create_suite_result()
     output_id = get_random_string(n=25)
@@ -103,6 +113,44 @@ def are_navigation_links_present(
     ))
 
 
+def test_html_serialization_failures_list():
+    suite_result = create_suite_result(n_of_results=2, n_of_failures=2)
+    output = HtmlSerializer(suite_result).prepare_failures_list()
+    soup = BeautifulSoup(output, 'html.parser')
+
+    assert_that(
+        [th.text for th in soup.select('table thead th')],
+        contains_exactly('Check', 'Reason')
+    )
+    assert_that(
+        [td.text for td in soup.select('table tbody tr td:nth-of-type(2)')],
+        contains_exactly(
+            'Exception Message 0',
+            'Exception Message 1',
+            *['Nothing found'] * 4
+        )
+    )
+
+
+def test_html_serialization_prologue():
+    check_types = [type(f'Check{name}', (DummyCheck,), {}) for name in 'ABCDE']
+    results = []
+    for check_type in [*check_types[:3], check_types[0], *check_types[3:]]:
+        result = create_check_result()
+        result.check = check_type()
+        results.append(result)
+
+    short_prologue = HtmlSerializer(SuiteResult(name='Suite', results=results[:4])).prepare_prologue()
+    long_prologue = HtmlSerializer(SuiteResult(name='Suite', results=results)).prepare_prologue()
+
+    assert_that(short_prologue, equal_to(
+        'The suite is composed of the following checks: Check A, Check B, Check C.'
+    ))
+    assert_that(long_prologue, equal_to(
+        'The suite is composed of various checks such as: Check A, Check B, Check C, etc...'
+    ))
+
+
 def test_html_serialization_with_plotply_activation_script():
     result = create_suite_result()
     output = HtmlSerializer(result).serialize()
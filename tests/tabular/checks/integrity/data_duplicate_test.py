@@ -41,6 +41,36 @@ def test_data_duplicates_categorical_dtypes():
     assert_that(check_obj.run(duplicate_data).value, close_to(0.0, 0.001))
 
 
+def test_data_duplicates_mixed_object_types():
+    duplicate_data = pd.DataFrame({'a': pd.Series([1, '1', 2.5, '2.5', False, 'False'], dtype=object)})
+    check_obj = DataDuplicates()
+    assert_that(check_obj.run(duplicate_data).value, close_to(0.0, 0.001))
+
+
+def test_data_duplicates_signed_zero():
+    duplicate_data = pd.DataFrame({'a': [0.0, -0.0, 1.0]})
+    check_obj = DataDuplicates()
+    assert_that(check_obj.run(duplicate_data).value, close_to(0.333, 0.001))
+
+
+def test_data_duplicates_signed_nan():
+    values = np.array([np.nan, 1.0])
+    duplicate_data = pd.DataFrame({'a': np.concatenate([values, -values[:1]])})
+    check_obj = DataDuplicates()
+    assert_that(check_obj.run(duplicate_data).value, close_to(0.333, 0.001))
+
+
+def test_data_duplicates_display_instances():
+    duplicate_data = pd.DataFrame({'col1': [1, 2, 1, np.nan, 1, np.nan],
+                                   'col2': ['a', 'b', 'a', None, 'a', None]})
+    result = DataDuplicates().run(duplicate_data)
+    instances = [
+        (sorted(int(it) for it in instances.split(', ')), n_duplicates)
+        for instances, n_duplicates in result.display[2].index
+    ]
+    assert_that(instances, equal_to([([0, 2, 4], 3), ([3, 5], 2)]))
+
+
 def test_data_duplicates_columns():
     duplicate_data = pd.DataFrame({'col1': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
                                    'col2': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
@@ -62,9 +92,37 @@ def test_data_duplicates_n_to_show():
                                    'col2': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
                                    'col3': [2, 3, 4, 4, 4, 3, 4, 5, 6, 4]})
     check_obj = DataDuplicates(n_to_show=2)
+    result = check_obj.run(duplicate_data)
+    assert_that(result.value, close_to(0.40, 0.01))
+    assert_that(result.display[2], has_length(2))
+
+
+def test_data_duplicates_n_to_show_zero():
+    duplicate_data = pd.DataFrame({'col1': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+                                   'col2': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+                                   'col3': [2, 3, 4, 4, 4, 3, 4, 5, 6, 4]})
+    result = DataDuplicates(n_to_show=0).run(duplicate_data)
+    assert_that(result.value, close_to(0.40, 0.01))
+    assert_that(result.display[2], has_length(0))
+
+
+def test_data_duplicates_without_sampling():
+    duplicate_data = pd.DataFrame({'col1': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+                                   'col2': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+                                   'col3': [2, 3, 4, 4, 4, 3, 4, 5, 6, 4]})
+    check_obj = DataDuplicates(n_samples=None)
     assert_that(check_obj.run(duplicate_data).value, close_to(0.40, 0.01))
 
 
+def test_data_duplicates_without_display():
+    duplicate_data = pd.DataFrame({'col1': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+                                   'col2': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+                                   'col3': [2, 3, 4, 4, 4, 3, 4, 5, 6, 4]})
+    result = DataDuplicates().run(duplicate_data, with_display=False)
+    assert_that(result.value, close_to(0.40, 0.01))
+    assert_that(result.display, has_length(0))
+
+
 def test_data_duplicates_no_duplicate():
     duplicate_data = pd.DataFrame({'col1': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
                                    'col2': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
@@ -97,6 +155,8 @@ def test_anonymous_series():
     res = DataDuplicates(ignore_columns=['index']).run(df)
     assert_that(res.value, close_to(0.05, 0.001))
     assert_that(res.display, has_length(3))
+    assert_that(res.display[2].columns.to_list(), equal_to([0, 1, 2]))
+    assert_that(res.display[2].index.names, equal_to(['Instances', 'Number of Duplicates']))
 
 def test_anonymous_series_without_display():
     np.random.seed(42)